@@ -1,7 +1,9 @@
 import math
 import random
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field, replace
+from itertools import islice
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
 
 import pygame
 
@@ -9,6 +11,7 @@ import pygame
 SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
 FPS = 60
+TEXT_CACHE_SIZE = 512
 
 GLOBAL_MAP_BACKGROUND = (20, 28, 44)
 TACTICAL_BG = (15, 18, 26)
@@ -18,40 +21,48 @@ ENEMY_COLOR = (218, 85, 81)
 TEXT_COLOR = (230, 230, 230)
 HIGHLIGHT_COLOR = (247, 226, 107)
 OVERLAY_BG = (14, 14, 18, 220)
-
-
-@dataclass
+PANEL_COLOR = (26, 30, 42)
+MAP_PANEL_COLOR = (35, 45, 60)
+
+# Shared, mutable Rects: read them or pass them to draw calls, never mutate them in place (*_ip).
+MAP_PANEL_RECT = pygame.Rect(80, 120, SCREEN_WIDTH - 160, SCREEN_HEIGHT - 180)
+INFO_PANEL_RECT = pygame.Rect(60, SCREEN_HEIGHT - 140, SCREEN_WIDTH - 120, 100)
+HUD_RECT = pygame.Rect(40, 20, SCREEN_WIDTH - 80, 40)
+LOG_RECT = pygame.Rect(40, SCREEN_HEIGHT - 200, SCREEN_WIDTH - 80, 160)
+OVERLAY_SIZE = (SCREEN_WIDTH - 200, SCREEN_HEIGHT - 200)
+TACTICAL_OFFSET_Y = 80
+
+COMBAT_LOG_SIZE = 16
+COMBAT_LOG_VISIBLE = 6
+LOG_ENTER = "You enter {}! Prepare for battle."
+LOG_PLAYER_HIT = "You strike {} for {} damage."
+LOG_ENEMY_FALLS = "{} falls!"
+LOG_VICTORY = "The battle is won!"
+LOG_ENEMY_HIT = "{} hits you for {} damage!"
+LOG_LOOT = "You claim {}! ({})"
+LOG_XP = "You gain {} XP."
+
+LogEntry = Tuple[str, Tuple[object, ...]]
+
+
+@dataclass(frozen=True, slots=True)
 class Stats:
     max_hp: int = 30
     attack: int = 5
     defense: int = 2
     initiative: int = 3
 
-    def add(self, other: "Stats") -> "Stats":
-        return Stats(
-            max_hp=self.max_hp + other.max_hp,
-            attack=self.attack + other.attack,
-            defense=self.defense + other.defense,
-            initiative=self.initiative + other.initiative,
-        )
-
-    def with_bonus(
-        self,
-        *,
-        hp: int = 0,
-        attack: int = 0,
-        defense: int = 0,
-        initiative: int = 0,
-    ) -> "Stats":
-        return Stats(
-            max_hp=self.max_hp + hp,
-            attack=self.attack + attack,
-            defense=self.defense + defense,
-            initiative=self.initiative + initiative,
-        )
+    def add_all(self, others: Iterable["Stats"]) -> "Stats":
+        max_hp, attack, defense, initiative = self.max_hp, self.attack, self.defense, self.initiative
+        for other in others:
+            max_hp += other.max_hp
+            attack += other.attack
+            defense += other.defense
+            initiative += other.initiative
+        return Stats(max_hp=max_hp, attack=attack, defense=defense, initiative=initiative)
 
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     name: str
     slot: str
@@ -61,37 +72,49 @@ class Item:
     defense_bonus: int = 0
     initiative_bonus: int = 0
     description: str = ""
+    _bonus: Stats = field(init=False, repr=False, compare=False)
 
-    def bonus_stats(self) -> Stats:
-        return Stats(
+    def __post_init__(self) -> None:
+        self._bonus = Stats(
             max_hp=self.hp_bonus,
             attack=self.attack_bonus,
             defense=self.defense_bonus,
             initiative=self.initiative_bonus,
         )
 
+    def bonus_stats(self) -> Stats:
+        return self._bonus
+
 
 class Inventory:
-    def __init__(self) -> None:
-        self.slots: Dict[str, Optional[Item]] = {
-            "weapon": None,
-            "armor": None,
-            "trinket": None,
-        }
+    __slots__ = ("weapon", "armor", "trinket", "bag", "on_change")
+
+    def __init__(self, on_change: Optional[Callable[[], None]] = None) -> None:
+        self.on_change = on_change
+        self.weapon: Optional[Item] = None
+        self.armor: Optional[Item] = None
+        self.trinket: Optional[Item] = None
         self.bag: List[Item] = []
 
     def equipped_items(self) -> List[Item]:
-        return [item for item in self.slots.values() if item]
+        return [item for item in (self.weapon, self.armor, self.trinket) if item]
 
     def add(self, item: Item) -> None:
-        if item.slot in self.slots and self.slots[item.slot] is None:
-            self.slots[item.slot] = item
+        if item.slot == "weapon" and self.weapon is None:
+            self.weapon = item
+        elif item.slot == "armor" and self.armor is None:
+            self.armor = item
+        elif item.slot == "trinket" and self.trinket is None:
+            self.trinket = item
         else:
             self.bag.append(item)
+            return
+        if self.on_change:
+            self.on_change()
 
     def summary_lines(self) -> List[str]:
         lines = ["Equipped:"]
-        for slot, item in self.slots.items():
+        for slot, item in (("weapon", self.weapon), ("armor", self.armor), ("trinket", self.trinket)):
             if item:
                 lines.append(f"  {slot.title()}: {item.name} ({item.rarity})")
             else:
@@ -107,7 +130,7 @@ class Inventory:
         return lines
 
 
-@dataclass
+@dataclass(slots=True)
 class Talent:
     key: str
     name: str
@@ -117,79 +140,113 @@ class Talent:
     defense_bonus: int = 0
     initiative_bonus: int = 0
     acquired: bool = False
+    _bonus: Stats = field(init=False, repr=False, compare=False)
 
-    def apply(self, stats: Stats) -> Stats:
-        if not self.acquired:
-            return stats
-        return stats.with_bonus(
-            hp=self.hp_bonus,
+    def __post_init__(self) -> None:
+        self._bonus = Stats(
+            max_hp=self.hp_bonus,
             attack=self.attack_bonus,
             defense=self.defense_bonus,
             initiative=self.initiative_bonus,
         )
 
+    def bonus_stats(self) -> Stats:
+        return self._bonus
+
+
+_TALENT_TEMPLATES: Tuple[Talent, ...] = (
+    Talent(
+        key="blade_mastery",
+        name="Blade Mastery",
+        description="+2 Attack from rigorous sword training.",
+        attack_bonus=2,
+    ),
+    Talent(
+        key="shield_wall",
+        name="Shield Wall",
+        description="+2 Defense by learning dwarven guard stances.",
+        defense_bonus=2,
+    ),
+    Talent(
+        key="veterans_vigor",
+        name="Veteran's Vigor",
+        description="+10 Max HP from hardened adventures.",
+        hp_bonus=10,
+    ),
+    Talent(
+        key="swift_foot",
+        name="Swift Foot",
+        description="+1 Initiative for faster turns.",
+        initiative_bonus=1,
+    ),
+)
+_TALENT_INDEX: Dict[str, int] = {talent.key: index for index, talent in enumerate(_TALENT_TEMPLATES)}
+
 
 class TalentTree:
-    def __init__(self) -> None:
-        self.talents: Dict[str, Talent] = {
-            "blade_mastery": Talent(
-                key="blade_mastery",
-                name="Blade Mastery",
-                description="+2 Attack from rigorous sword training.",
-                attack_bonus=2,
-            ),
-            "shield_wall": Talent(
-                key="shield_wall",
-                name="Shield Wall",
-                description="+2 Defense by learning dwarven guard stances.",
-                defense_bonus=2,
-            ),
-            "veterans_vigor": Talent(
-                key="veterans_vigor",
-                name="Veteran's Vigor",
-                description="+10 Max HP from hardened adventures.",
-                hp_bonus=10,
-            ),
-            "swift_foot": Talent(
-                key="swift_foot",
-                name="Swift Foot",
-                description="+1 Initiative for faster turns.",
-                initiative_bonus=1,
-            ),
-        }
+    __slots__ = ("_talents", "on_change")
+
+    def __init__(self, on_change: Optional[Callable[[], None]] = None) -> None:
+        self.on_change = on_change
+        self._talents: Tuple[Talent, ...] = tuple(replace(talent) for talent in _TALENT_TEMPLATES)
 
     def acquire(self, key: str) -> bool:
-        talent = self.talents.get(key)
-        if talent and not talent.acquired:
+        index = _TALENT_INDEX.get(key)
+        if index is None:
+            return False
+        talent = self._talents[index]
+        if not talent.acquired:
             talent.acquired = True
+            if self.on_change:
+                self.on_change()
             return True
         return False
 
-    def apply(self, stats: Stats) -> Stats:
-        for talent in self.talents.values():
-            stats = talent.apply(stats)
-        return stats
+    def bonuses(self) -> List[Stats]:
+        return [talent.bonus_stats() for talent in self._talents if talent.acquired]
 
-    def ordered(self) -> List[Talent]:
-        return list(self.talents.values())
+    def ordered(self) -> Tuple[Talent, ...]:
+        return self._talents
 
 
 class Player:
+    __slots__ = (
+        "base_stats",
+        "current_hp",
+        "inventory",
+        "talents",
+        "level",
+        "xp",
+        "talent_points",
+        "_stats_cache",
+        "_stats_dirty",
+    )
+
     def __init__(self) -> None:
         self.base_stats = Stats()
         self.current_hp = self.base_stats.max_hp
-        self.inventory = Inventory()
-        self.talents = TalentTree()
+        self.inventory = Inventory(on_change=self._invalidate_stats)
+        self.talents = TalentTree(on_change=self._invalidate_stats)
         self.level = 1
         self.xp = 0
         self.talent_points = 1
+        self._stats_cache = self.base_stats
+        self._stats_dirty = True
+
+    def _invalidate_stats(self) -> None:
+        self._stats_dirty = True
+
+    def _compute_stats(self) -> Stats:
+        bonuses = [item.bonus_stats() for item in self.inventory.equipped_items()]
+        bonuses.extend(self.talents.bonuses())
+        return self.base_stats.add_all(bonuses)
 
     @property
     def stats(self) -> Stats:
-        stats = self.base_stats
-        for item in self.inventory.equipped_items():
-            stats = stats.add(item.bonus_stats())
-        stats = self.talents.apply(stats)
+        if self._stats_dirty:
+            self._stats_cache = self._compute_stats()
+            self._stats_dirty = False
+        stats = self._stats_cache
         if self.current_hp > stats.max_hp:
             self.current_hp = stats.max_hp
         return stats
@@ -198,33 +255,48 @@ class Player:
         self.current_hp = self.stats.max_hp
 
     def gain_xp(self, amount: int) -> None:
-        self.xp += amount
-        while self.xp >= self.xp_to_next_level:
-            self.xp -= self.xp_to_next_level
-            self.level += 1
-            self.talent_points += 1
+        if amount <= 0:
+            self.xp += amount
+            return
+        total = self.xp_for_level(self.level) + self.xp + amount
+        # Solve 25n^2 + 75n <= total for the largest n = level - 1.
+        new_level = max(self.level, (math.isqrt(max(0, 4 * total + 225)) - 15) // 10 + 1)
+        self.xp = total - self.xp_for_level(new_level)
+        self.talent_points += new_level - self.level
+        self.level = new_level
 
     @property
     def xp_to_next_level(self) -> int:
         return 100 + (self.level - 1) * 50
 
+    @staticmethod
+    def xp_for_level(level: int) -> int:
+        n = level - 1
+        return 25 * n * n + 75 * n
+
     def is_alive(self) -> bool:
         return self.current_hp > 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Location:
     name: str
     description: str
     difficulty: int
     position: Tuple[int, int]
     discovered: bool = True
+    radius: int = field(init=False, repr=False, compare=False)
+    color: Tuple[int, int, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.radius = 16 + self.difficulty * 2
+        self.color = (90 + self.difficulty * 20, 110, 160)
 
     def enemy_count(self) -> int:
         return max(1, self.difficulty + random.randint(0, 1))
 
 
-@dataclass
+@dataclass(slots=True)
 class Enemy:
     name: str
     hp: int
@@ -233,25 +305,38 @@ class Enemy:
     initiative: int
     position: Tuple[int, int]
 
-    def is_adjacent_to(self, other: Tuple[int, int]) -> bool:
-        return abs(self.position[0] - other[0]) + abs(self.position[1] - other[1]) == 1
-
 
 class TacticalEncounter:
+    __slots__ = (
+        "player",
+        "location",
+        "grid_size",
+        "tile_size",
+        "hero_pos",
+        "turn",
+        "enemies",
+        "_enemy_positions",
+        "log",
+        "victory",
+        "defeat",
+    )
+
     def __init__(self, player: Player, location: Location) -> None:
         self.player = player
         self.location = location
         self.grid_size = (12, 8)
         self.tile_size = 64
-        self.hero_pos = [self.grid_size[0] // 2, self.grid_size[1] - 2]
+        self.hero_pos: Tuple[int, int] = (self.grid_size[0] // 2, self.grid_size[1] - 2)
         self.turn = "player"
         self.enemies: List[Enemy] = self._spawn_enemies()
-        self.log: List[str] = [f"You enter {location.name}! Prepare for battle."]
+        self._enemy_positions: Set[Tuple[int, int]] = {enemy.position for enemy in self.enemies}
+        self.log: Deque[LogEntry] = deque([(LOG_ENTER, (location.name,))], maxlen=COMBAT_LOG_SIZE)
         self.victory = False
         self.defeat = False
 
     def _spawn_enemies(self) -> List[Enemy]:
         enemies: List[Enemy] = []
+        taken: Set[Tuple[int, int]] = set()
         for _ in range(self.location.enemy_count()):
             hp = random.randint(12, 20) + self.location.difficulty * 4
             attack = 3 + self.location.difficulty
@@ -259,6 +344,10 @@ class TacticalEncounter:
             initiative = 2
             x = random.randint(1, self.grid_size[0] - 2)
             y = random.randint(1, 2)
+            while (x, y) in taken:
+                x = random.randint(1, self.grid_size[0] - 2)
+                y = random.randint(1, 2)
+            taken.add((x, y))
             enemies.append(
                 Enemy(
                     name="Orc Marauder",
@@ -276,25 +365,29 @@ class TacticalEncounter:
             return
         new_x = max(0, min(self.grid_size[0] - 1, self.hero_pos[0] + dx))
         new_y = max(0, min(self.grid_size[1] - 1, self.hero_pos[1] + dy))
-        if not any(enemy.position == (new_x, new_y) for enemy in self.enemies):
-            self.hero_pos = [new_x, new_y]
+        if (new_x, new_y) not in self._enemy_positions:
+            self.hero_pos = (new_x, new_y)
 
     def player_attack(self) -> None:
         if self.turn != "player":
             return
-        for enemy in self.enemies:
-            if enemy.is_adjacent_to(tuple(self.hero_pos)):
+        hx, hy = self.hero_pos
+        for index, enemy in enumerate(self.enemies):
+            dx = enemy.position[0] - hx
+            dy = enemy.position[1] - hy
+            if dx * dx + dy * dy == 1:
                 damage = max(0, self.player.stats.attack - enemy.defense)
                 damage = max(1, damage)
                 enemy.hp -= damage
-                self.log.append(f"You strike {enemy.name} for {damage} damage.")
+                self.log.append((LOG_PLAYER_HIT, (enemy.name, damage)))
                 if enemy.hp <= 0:
-                    self.log.append(f"{enemy.name} falls!")
+                    self.log.append((LOG_ENEMY_FALLS, (enemy.name,)))
+                    self.enemies.pop(index)
+                    self._enemy_positions.discard(enemy.position)
                 break
-        self.enemies = [enemy for enemy in self.enemies if enemy.hp > 0]
         if not self.enemies:
             self.victory = True
-            self.log.append("The battle is won!")
+            self.log.append((LOG_VICTORY, ()))
         self.turn = "enemies"
 
     def end_player_turn(self) -> None:
@@ -303,25 +396,30 @@ class TacticalEncounter:
 
     def update(self) -> None:
         if self.turn == "enemies":
-            for enemy in self.enemies:
-                self._enemy_take_turn(enemy)
+            self._enemies_take_turn()
             self.turn = "player"
         if self.player.current_hp <= 0:
             self.defeat = True
 
-    def _enemy_take_turn(self, enemy: Enemy) -> None:
-        hero_pos = tuple(self.hero_pos)
-        if enemy.is_adjacent_to(hero_pos):
-            damage = max(0, enemy.attack - self.player.stats.defense)
-            damage = max(1, damage)
-            self.player.current_hp -= damage
-            self.log.append(f"{enemy.name} hits you for {damage} damage!")
-            return
-        dx = int(math.copysign(1, hero_pos[0] - enemy.position[0])) if enemy.position[0] != hero_pos[0] else 0
-        dy = int(math.copysign(1, hero_pos[1] - enemy.position[1])) if enemy.position[1] != hero_pos[1] else 0
-        target = (enemy.position[0] + dx, enemy.position[1] + dy)
-        if target != hero_pos and not any(e.position == target for e in self.enemies):
-            enemy.position = target
+    def _enemies_take_turn(self) -> None:
+        hero_pos = self.hero_pos
+        hx, hy = hero_pos
+        defense = self.player.stats.defense
+        occupied = self._enemy_positions
+        for enemy in self.enemies:
+            ex, ey = enemy.position
+            dx = hx - ex
+            dy = hy - ey
+            if dx * dx + dy * dy == 1:
+                damage = max(1, enemy.attack - defense)
+                self.player.current_hp -= damage
+                self.log.append((LOG_ENEMY_HIT, (enemy.name, damage)))
+                continue
+            target = (ex + (dx > 0) - (dx < 0), ey + (dy > 0) - (dy < 0))
+            if target != hero_pos and target not in occupied:
+                occupied.discard(enemy.position)
+                occupied.add(target)
+                enemy.position = target
 
     def generate_loot(self) -> Item:
         rarity_roll = random.random()
@@ -348,6 +446,28 @@ class TacticalEncounter:
 
 
 class Game:
+    __slots__ = (
+        "screen",
+        "clock",
+        "font",
+        "title_font",
+        "running",
+        "player",
+        "locations",
+        "selected_location_index",
+        "state",
+        "encounter",
+        "show_inventory",
+        "show_talents",
+        "_text_cache",
+        "_map_background",
+        "_overlay_surface",
+        "_grid_surfaces",
+        "_wrapped_text",
+        "_dirty",
+        "_circle_surfaces",
+    )
+
     def __init__(self) -> None:
         pygame.init()
         pygame.display.set_caption("Epic Quest")
@@ -363,6 +483,69 @@ class Game:
         self.encounter: Optional[TacticalEncounter] = None
         self.show_inventory = False
         self.show_talents = False
+        self._text_cache: "OrderedDict[Tuple[int, str, Tuple[int, ...]], pygame.Surface]" = OrderedDict()
+        self._map_background = self._create_map_background()
+        self._overlay_surface = pygame.Surface(OVERLAY_SIZE, pygame.SRCALPHA)
+        self._grid_surfaces: Dict[Tuple[Tuple[int, int], int], pygame.Surface] = {}
+        self._wrapped_text: Dict[Tuple[str, int], List[str]] = {}
+        self._dirty = True
+        self._circle_surfaces: Dict[Tuple[int, Tuple[int, int, int], int], pygame.Surface] = {}
+
+    def _render(self, font: pygame.font.Font, text: str, color: Tuple[int, ...]) -> pygame.Surface:
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+            if len(self._text_cache) > TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return surface
+
+    def _wrap(self, text: str, width: int) -> List[str]:
+        key = (text, width)
+        lines = self._wrapped_text.get(key)
+        if lines is None:
+            lines = wrap_text(text, width)
+            self._wrapped_text[key] = lines
+        return lines
+
+    def _circle_surface(self, radius: int, color: Tuple[int, int, int], width: int = 0) -> pygame.Surface:
+        key = (radius, color, width)
+        surface = self._circle_surfaces.get(key)
+        if surface is None:
+            surface = pygame.Surface((radius * 2 + 2, radius * 2 + 2), pygame.SRCALPHA)
+            pygame.draw.circle(surface, color, (radius + 1, radius + 1), radius, width)
+            self._circle_surfaces[key] = surface
+        return surface
+
+    @staticmethod
+    def _tile_rect(offset_x: int, offset_y: int, tile: int, position: Tuple[int, int], inset: int) -> pygame.Rect:
+        return pygame.Rect(
+            offset_x + position[0] * tile + inset,
+            offset_y + position[1] * tile + inset,
+            tile - inset * 2,
+            tile - inset * 2,
+        )
+
+    def _create_map_background(self) -> pygame.Surface:
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        surface.fill(GLOBAL_MAP_BACKGROUND)
+        pygame.draw.rect(surface, MAP_PANEL_COLOR, MAP_PANEL_RECT, border_radius=30)
+        return surface
+
+    def _grid_surface(self, encounter: TacticalEncounter) -> pygame.Surface:
+        key = (encounter.grid_size, encounter.tile_size)
+        surface = self._grid_surfaces.get(key)
+        if surface is None:
+            tile = encounter.tile_size
+            surface = pygame.Surface((encounter.grid_size[0] * tile, encounter.grid_size[1] * tile), pygame.SRCALPHA)
+            for y in range(encounter.grid_size[1]):
+                for x in range(encounter.grid_size[0]):
+                    pygame.draw.rect(surface, GRID_COLOR, pygame.Rect(x * tile, y * tile, tile, tile), 1)
+            self._grid_surfaces[key] = surface
+        return surface
 
     def _create_locations(self) -> List[Location]:
         return [
@@ -439,11 +622,16 @@ class Game:
             self.clock.tick(FPS)
             self.handle_events()
             self.update()
-            self.draw()
+            if self._dirty:
+                self.draw()
+                self._dirty = False
         pygame.quit()
 
     def handle_events(self) -> None:
-        for event in pygame.event.get():
+        event = pygame.event.wait(1000 // FPS)
+        while event.type != pygame.NOEVENT:
+            if event.type != pygame.MOUSEMOTION:
+                self._dirty = True
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
@@ -459,6 +647,7 @@ class Game:
                     self.handle_global_key(event.key)
                 elif self.state == "tactical":
                     self.handle_tactical_key(event.key)
+            event = pygame.event.poll()
 
     def handle_global_key(self, key: int) -> None:
         if key in (pygame.K_LEFT, pygame.K_UP):
@@ -490,6 +679,8 @@ class Game:
 
     def update(self) -> None:
         if self.state == "tactical" and self.encounter:
+            if self.encounter.turn == "enemies":
+                self._dirty = True
             self.encounter.update()
             if self.encounter.victory:
                 self.on_victory()
@@ -504,8 +695,8 @@ class Game:
         xp_gain = 50 + self.encounter.location.difficulty * 25
         self.player.gain_xp(xp_gain)
         self.player.heal_full()
-        self.encounter.log.append(f"You claim {loot.name}! ({loot.rarity})")
-        self.encounter.log.append(f"You gain {xp_gain} XP.")
+        self.encounter.log.append((LOG_LOOT, (loot.name, loot.rarity)))
+        self.encounter.log.append((LOG_XP, (xp_gain,)))
         self.state = "global_map"
         self.encounter = None
 
@@ -522,42 +713,40 @@ class Game:
         pygame.display.flip()
 
     def draw_global_map(self) -> None:
-        self.screen.fill(GLOBAL_MAP_BACKGROUND)
-        pygame.draw.rect(self.screen, (35, 45, 60), (80, 120, SCREEN_WIDTH - 160, SCREEN_HEIGHT - 180), border_radius=30)
+        self.screen.blit(self._map_background, (0, 0))
         for index, location in enumerate(self.locations):
             x, y = location.position
-            radius = 16 + location.difficulty * 2
-            color = (90 + location.difficulty * 20, 110, 160)
-            pygame.draw.circle(self.screen, color, (x, y), radius)
+            radius = location.radius
+            self.screen.blit(self._circle_surface(radius, location.color), (x - radius - 1, y - radius - 1))
             if index == self.selected_location_index:
-                pygame.draw.circle(self.screen, HIGHLIGHT_COLOR, (x, y), radius + 4, 3)
-            label = self.font.render(location.name, True, TEXT_COLOR)
+                outline = radius + 4
+                self.screen.blit(self._circle_surface(outline, HIGHLIGHT_COLOR, 3), (x - outline - 1, y - outline - 1))
+            label = self._render(self.font, location.name, TEXT_COLOR)
             self.screen.blit(label, (x - label.get_width() // 2, y - radius - 22))
 
-        header = self.title_font.render("The Realms of the West", True, TEXT_COLOR)
+        header = self._render(self.title_font, "The Realms of the West", TEXT_COLOR)
         self.screen.blit(header, (SCREEN_WIDTH // 2 - header.get_width() // 2, 24))
 
         location = self.locations[self.selected_location_index]
-        panel_rect = pygame.Rect(60, SCREEN_HEIGHT - 140, SCREEN_WIDTH - 120, 100)
-        pygame.draw.rect(self.screen, (26, 30, 42), panel_rect, border_radius=18)
-        name_text = self.font.render(f"{location.name} (Danger {location.difficulty})", True, TEXT_COLOR)
-        desc_text = self.font.render(location.description, True, TEXT_COLOR)
-        self.screen.blit(name_text, (panel_rect.x + 20, panel_rect.y + 14))
-        self.screen.blit(desc_text, (panel_rect.x + 20, panel_rect.y + 48))
+        pygame.draw.rect(self.screen, PANEL_COLOR, INFO_PANEL_RECT, border_radius=18)
+        name_text = self._render(self.font, f"{location.name} (Danger {location.difficulty})", TEXT_COLOR)
+        desc_text = self._render(self.font, location.description, TEXT_COLOR)
+        self.screen.blit(name_text, (INFO_PANEL_RECT.x + 20, INFO_PANEL_RECT.y + 14))
+        self.screen.blit(desc_text, (INFO_PANEL_RECT.x + 20, INFO_PANEL_RECT.y + 48))
 
         stats = self.player.stats
-        stats_text = self.font.render(
+        stats_text = self._render(
+            self.font,
             f"HP {self.player.current_hp}/{stats.max_hp}  ATK {stats.attack}  DEF {stats.defense}  INIT {stats.initiative}  LVL {self.player.level}",
-            True,
             TEXT_COLOR,
         )
-        self.screen.blit(stats_text, (panel_rect.x + 20, panel_rect.y + 72))
-        xp_text = self.font.render(
+        self.screen.blit(stats_text, (INFO_PANEL_RECT.x + 20, INFO_PANEL_RECT.y + 72))
+        xp_text = self._render(
+            self.font,
             f"XP: {self.player.xp}/{self.player.xp_to_next_level}  Talent Points: {self.player.talent_points}",
-            True,
             TEXT_COLOR,
         )
-        self.screen.blit(xp_text, (panel_rect.x + 420, panel_rect.y + 72))
+        self.screen.blit(xp_text, (INFO_PANEL_RECT.x + 420, INFO_PANEL_RECT.y + 72))
 
         if self.show_inventory:
             self.draw_inventory_overlay()
@@ -571,49 +760,29 @@ class Game:
         width = encounter.grid_size[0] * encounter.tile_size
         height = encounter.grid_size[1] * encounter.tile_size
         offset_x = (SCREEN_WIDTH - width) // 2
-        offset_y = 80
-        for y in range(encounter.grid_size[1]):
-            for x in range(encounter.grid_size[0]):
-                rect = pygame.Rect(
-                    offset_x + x * encounter.tile_size,
-                    offset_y + y * encounter.tile_size,
-                    encounter.tile_size,
-                    encounter.tile_size,
-                )
-                pygame.draw.rect(self.screen, GRID_COLOR, rect, 1)
+        offset_y = TACTICAL_OFFSET_Y
+        self.screen.blit(self._grid_surface(encounter), (offset_x, offset_y))
 
-        hero_rect = pygame.Rect(
-            offset_x + encounter.hero_pos[0] * encounter.tile_size + 8,
-            offset_y + encounter.hero_pos[1] * encounter.tile_size + 8,
-            encounter.tile_size - 16,
-            encounter.tile_size - 16,
-        )
-        pygame.draw.rect(self.screen, HERO_COLOR, hero_rect)
+        tile = encounter.tile_size
+        self.screen.fill(HERO_COLOR, self._tile_rect(offset_x, offset_y, tile, encounter.hero_pos, 8))
 
         for enemy in encounter.enemies:
-            rect = pygame.Rect(
-                offset_x + enemy.position[0] * encounter.tile_size + 10,
-                offset_y + enemy.position[1] * encounter.tile_size + 10,
-                encounter.tile_size - 20,
-                encounter.tile_size - 20,
-            )
-            pygame.draw.rect(self.screen, ENEMY_COLOR, rect)
+            self.screen.fill(ENEMY_COLOR, self._tile_rect(offset_x, offset_y, tile, enemy.position, 10))
 
-        hud_rect = pygame.Rect(40, 20, SCREEN_WIDTH - 80, 40)
-        pygame.draw.rect(self.screen, (26, 30, 42), hud_rect, border_radius=12)
+        pygame.draw.rect(self.screen, PANEL_COLOR, HUD_RECT, border_radius=12)
         stats = self.player.stats
-        hud_text = self.font.render(
+        hud_text = self._render(
+            self.font,
             f"HP {self.player.current_hp}/{stats.max_hp}  ATK {stats.attack}  DEF {stats.defense}  INIT {stats.initiative}  Turn: {encounter.turn.title()}",
-            True,
             TEXT_COLOR,
         )
-        self.screen.blit(hud_text, (hud_rect.x + 14, hud_rect.y + 10))
+        self.screen.blit(hud_text, (HUD_RECT.x + 14, HUD_RECT.y + 10))
 
-        log_rect = pygame.Rect(40, SCREEN_HEIGHT - 200, SCREEN_WIDTH - 80, 160)
-        pygame.draw.rect(self.screen, (26, 30, 42), log_rect, border_radius=12)
-        for i, line in enumerate(encounter.log[-6:]):
-            text = self.font.render(line, True, TEXT_COLOR)
-            self.screen.blit(text, (log_rect.x + 14, log_rect.y + 14 + i * 22))
+        pygame.draw.rect(self.screen, PANEL_COLOR, LOG_RECT, border_radius=12)
+        visible = islice(encounter.log, max(0, len(encounter.log) - COMBAT_LOG_VISIBLE), None)
+        for i, (template, args) in enumerate(visible):
+            text = self._render(self.font, template.format(*args), TEXT_COLOR)
+            self.screen.blit(text, (LOG_RECT.x + 14, LOG_RECT.y + 14 + i * 22))
 
         if self.show_inventory:
             self.draw_inventory_overlay()
@@ -621,30 +790,30 @@ class Game:
             self.draw_talent_overlay()
 
     def draw_inventory_overlay(self) -> None:
-        surface = pygame.Surface((SCREEN_WIDTH - 200, SCREEN_HEIGHT - 200), pygame.SRCALPHA)
+        surface = self._overlay_surface
         surface.fill(OVERLAY_BG)
         lines = self.player.inventory.summary_lines()
         for i, line in enumerate(lines):
-            text = self.font.render(line, True, TEXT_COLOR)
+            text = self._render(self.font, line, TEXT_COLOR)
             surface.blit(text, (30, 30 + i * 24))
         self.screen.blit(surface, (100, 100))
 
     def draw_talent_overlay(self) -> None:
-        surface = pygame.Surface((SCREEN_WIDTH - 200, SCREEN_HEIGHT - 200), pygame.SRCALPHA)
+        surface = self._overlay_surface
         surface.fill(OVERLAY_BG)
-        header = self.title_font.render("Talent Tree", True, TEXT_COLOR)
+        header = self._render(self.title_font, "Talent Tree", TEXT_COLOR)
         surface.blit(header, (30, 20))
         for i, talent in enumerate(self.player.talents.ordered()):
             status = "Learned" if talent.acquired else "Locked"
-            text = self.font.render(f"[{i + 1}] {talent.name} - {status}", True, TEXT_COLOR)
+            text = self._render(self.font, f"[{i + 1}] {talent.name} - {status}", TEXT_COLOR)
             surface.blit(text, (30, 80 + i * 60))
-            desc_lines = wrap_text(talent.description, 46)
+            desc_lines = self._wrap(talent.description, 46)
             for j, line in enumerate(desc_lines):
-                desc_text = self.font.render(line, True, TEXT_COLOR)
+                desc_text = self._render(self.font, line, TEXT_COLOR)
                 surface.blit(desc_text, (60, 104 + i * 60 + j * 20))
-        footer = self.font.render("Press number key to learn talent if you have points.", True, TEXT_COLOR)
+        footer = self._render(self.font, "Press number key to learn talent if you have points.", TEXT_COLOR)
         surface.blit(footer, (30, surface.get_height() - 50))
-        points = self.font.render(f"Talent Points: {self.player.talent_points}", True, TEXT_COLOR)
+        points = self._render(self.font, f"Talent Points: {self.player.talent_points}", TEXT_COLOR)
         surface.blit(points, (surface.get_width() - 240, 24))
         self.screen.blit(surface, (100, 100))
 
@@ -657,16 +826,18 @@ class Game:
 
 
 def wrap_text(text: str, width: int) -> List[str]:
-    words = text.split()
     lines: List[str] = []
-    current = []
-    while words:
-        word = words.pop(0)
-        current.append(word)
-        if sum(len(w) for w in current) + len(current) - 1 > width:
-            current.pop()
+    current: List[str] = []
+    current_len = 0
+    for word in text.split():
+        added = len(word) + (1 if current else 0)
+        if current and current_len + added > width:
             lines.append(" ".join(current))
             current = [word]
+            current_len = len(word)
+        else:
+            current.append(word)
+            current_len += added
     if current:
         lines.append(" ".join(current))
     return lines
@@ -0,0 +1,45 @@
+from typing import Iterable, Tuple
+
+from main import Player
+
+
+def stepwise_levels(gains: Iterable[int]) -> Tuple[int, int, int]:
+    level, xp, talent_points = 1, 0, 1
+    for amount in gains:
+        xp += amount
+        while xp >= 100 + (level - 1) * 50:
+            xp -= 100 + (level - 1) * 50
+            level += 1
+            talent_points += 1
+    return level, xp, talent_points
+
+
+def closed_form_levels(gains: Iterable[int]) -> Tuple[int, int, int]:
+    player = Player()
+    for amount in gains:
+        player.gain_xp(amount)
+    return player.level, player.xp, player.talent_points
+
+
+def test_gain_xp_matches_stepwise_for_single_gains() -> None:
+    for amount in range(20000):
+        assert closed_form_levels([amount]) == stepwise_levels([amount])
+
+
+def test_gain_xp_matches_stepwise_for_mixed_gains() -> None:
+    gains = [99, 1, 149, 0, 2500, -57, 75, 10**6]
+    for i in range(len(gains) + 1):
+        assert closed_form_levels(gains[:i]) == stepwise_levels(gains[:i])
+
+
+def test_gain_xp_negative_amount_leaves_level() -> None:
+    assert closed_form_levels([-57]) == (1, -57, 1)
+
+
+def test_acquire_grants_matching_talent_per_player() -> None:
+    player, other = Player(), Player()
+    assert player.talents.acquire("shield_wall")
+    assert not player.talents.acquire("shield_wall")
+    assert [talent.key for talent in player.talents.ordered() if talent.acquired] == ["shield_wall"]
+    assert not any(talent.acquired for talent in other.talents.ordered())
+    assert player.stats.defense == other.stats.defense + 2